@@ -0,0 +1 @@
+# Lets the tests import monopoly.py from the repository root.
@@ -0,0 +1,20 @@
+# ---------------------------------------------
+# gunicorn_conf.py
+# Production server settings for the Monopoly backend
+# ---------------------------------------------
+# Run with: gunicorn -c gunicorn_conf.py
+# ---------------------------------------------
+
+import os
+
+wsgi_app = "wsgi:app"
+
+# Game state lives in process memory, so every request must reach the same
+# worker; concurrency comes from gevent greenlets, not extra processes.
+workers = 1
+worker_class = "gevent"
+worker_connections = 1000
+keepalive = 5
+
+# Put a reverse proxy (nginx) in front of the unix socket in production.
+bind = os.environ.get("MONOPOLY_BIND", "unix:/tmp/monopoly.sock")
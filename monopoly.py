@@ -0,0 +1,1102 @@
+# ---------------------------------------------
+# monopoly.py
+# Monopoly Game Backend (Extended Version)
+# ---------------------------------------------
+# Flask server that simulates Monopoly-style gameplay
+# Supports: Jail, Houses, Hotels, Trading, Mortgage, Reset, Chance & Community Chest
+# ---------------------------------------------
+
+from flask import Blueprint, Flask, current_app, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import numpy as np
+import os
+import random
+import threading
+
+try:
+    from numba import njit
+    JIT_COMPILED = True
+except ImportError:
+    JIT_COMPILED = False
+
+    def njit(*args, **kwargs):
+        # Without numba the simulation kernel still runs, just as plain Python
+        def decorate(fn):
+            return fn
+        return decorate
+
+try:
+    import orjson
+
+    def _encode_json(obj):
+        return orjson.dumps(obj)
+
+    _decode_json = orjson.loads
+except ImportError:
+    try:
+        import ujson
+
+        def _encode_json(obj):
+            return ujson.dumps(obj).encode()
+
+        _decode_json = ujson.loads
+    except ImportError:
+        _encode_json = _decode_json = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_MIMETYPE = "application/msgpack"
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider that uses orjson (or ujson) instead of stdlib json, both for
+    responses and for parsing request bodies."""
+
+    def dumps(self, obj, **kwargs):
+        return _encode_json(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return _decode_json(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(_encode_json(obj), mimetype=self.mimetype)
+
+
+# ---------------------------------------------
+# RANDOMNESS
+# ---------------------------------------------
+# Dice come from a batched stream: one random.choices() call covers 1024 turns,
+# which is far cheaper than two random.randint() calls per turn.
+_rng = random.Random()
+_DIE_FACES = range(1, 7)
+_DICE_BATCH = 2048
+_dice_stream = deque()
+
+
+def roll_dice_pair():
+    if not _dice_stream:
+        _dice_stream.extend(_rng.choices(_DIE_FACES, k=_DICE_BATCH))
+    return _dice_stream.popleft(), _dice_stream.popleft()
+
+
+def draw_card(deck):
+    size = len(deck)
+    if size & (size - 1) == 0:
+        # Power-of-two decks index straight off random bits
+        return deck[_rng.getrandbits(size.bit_length() - 1)]
+    return _rng.choice(deck)
+
+
+# ---------------------------------------------
+# GAME CLASSES
+# ---------------------------------------------
+INCOME_TAX = 200
+
+
+class Player:
+    __slots__ = ("name", "money", "position", "properties", "_props_by_name", "bankrupt",
+                 "in_jail", "jail_turns", "doubles_count", "get_out_of_jail_cards")
+
+    def __init__(self, name):
+        self.name = name
+        self.money = 1500
+        self.position = 0
+        self.properties = []
+        self._props_by_name = {}
+        self.bankrupt = False
+        self.in_jail = False           # Jail status
+        self.jail_turns = 0            # Number of turns in jail
+        self.doubles_count = 0         # Doubles rolled consecutively
+        self.get_out_of_jail_cards = 0 # Get Out of Jail Free cards
+
+    def move(self, steps, board):
+        if board.mask is not None:
+            self.position = (self.position + steps) & board.mask
+        else:
+            self.position = (self.position + steps) % board.size
+
+    def adjust_money(self, amount):
+        self.money += amount
+        return self.money >= 0
+
+    def get_property(self, name):
+        return self._props_by_name.get(name)
+
+    def add_property(self, prop):
+        self.properties.append(prop)
+        self._props_by_name[prop.name] = prop
+
+    def remove_property(self, prop):
+        self.properties.remove(prop)
+        del self._props_by_name[prop.name]
+
+    def declare_bankruptcy(self):
+        self.bankrupt = True
+        self.money = 0
+        for prop in self.properties:
+            prop.owner = None
+        self.properties = []
+        self._props_by_name = {}
+
+    def go_to_jail(self, jail_position):
+        self.position = jail_position
+        self.in_jail = True
+        self.jail_turns = 0
+        self.doubles_count = 0
+
+
+class Property:
+    __slots__ = ("name", "cost", "base_rent", "rent_levels", "owner",
+                 "mortgaged", "houses", "hotel", "_rent")
+
+    def __init__(self, name, cost, base_rent, rent_levels):
+        self.name = name
+        self.cost = cost
+        self.base_rent = base_rent
+        self.rent_levels = rent_levels
+        self.owner = None
+        self.mortgaged = False
+        self.houses = 0
+        self.hotel = False
+        self._update_rent()
+
+    def _update_rent(self):
+        # Rent only changes when building or (un)mortgaging, so it is cached
+        # here instead of being recomputed on every landing.
+        if self.mortgaged:
+            self._rent = 0
+        elif self.hotel:
+            self._rent = self.rent_levels[-1]
+        else:
+            self._rent = self.rent_levels[self.houses]
+
+    def get_rent(self):
+        return self._rent
+
+    def buy(self, player):
+        if self.owner is None and player.money >= self.cost:
+            player.adjust_money(-self.cost)
+            self.owner = player
+            player.add_property(self)
+            return True
+        return False
+
+    def build_house(self, player):
+        if self.owner == player and not self.mortgaged and self.houses < 4 and not self.hotel:
+            cost = int(self.cost * 0.5)
+            if player.money >= cost:
+                player.adjust_money(-cost)
+                self.houses += 1
+                self._update_rent()
+                return True
+        return False
+
+    def build_hotel(self, player):
+        if self.owner == player and not self.mortgaged and self.houses == 4 and not self.hotel:
+            cost = int(self.cost * 0.75)
+            if player.money >= cost:
+                player.adjust_money(-cost)
+                self.hotel = True
+                self.houses = 0
+                self._update_rent()
+                return True
+        return False
+
+    def mortgage(self, player):
+        if self.owner == player and not self.mortgaged:
+            self.mortgaged = True
+            self._update_rent()
+            player.adjust_money(self.cost // 2)
+            return True
+        return False
+
+    def unmortgage(self, player):
+        if self.owner == player and self.mortgaged:
+            fee = int(self.cost * 0.6)
+            if player.money >= fee:
+                player.adjust_money(-fee)
+                self.mortgaged = False
+                self._update_rent()
+                return True
+        return False
+
+
+class Board:
+    def __init__(self):
+        self.spaces = [
+            "GO",
+            Property("Renzo House", 100, 50, [10, 50, 150, 450, 625, 750]),
+            "Community Chest",
+            Property("Kyle Tower", 120, 50, [12, 60, 180, 500, 700, 900]),
+            "Income Tax",
+            Property("Crisostomo Plaza", 200, 100, [25, 100, 300, 750, 925, 1100]),
+            "Chance",
+            Property("Macmac Pavilion", 140, 70, [14, 70, 200, 550, 750, 950]),
+            Property("Mike House", 160, 80, [16, 80, 220, 600, 800, 1000]),
+            "Jail",
+            Property("Leenor Estate", 200, 100, [25, 100, 300, 750, 925, 1100]),
+            "Community Chest",
+            Property("Malate", 100, 50, [10, 50, 150, 450, 625, 750]),
+            "Income Tax",
+            Property("Bagong Pook", 120, 50, [12, 60, 180, 500, 700, 900]),
+            "Free Parking",
+            Property("Dark Tower", 200, 100, [25, 100, 300, 750, 925, 1100]),
+        ]
+        self.size = len(self.spaces)
+        # Wrap-around is a bitmask when the board size is a power of two
+        self.mask = self.size - 1 if self.size & (self.size - 1) == 0 else None
+        self.go_position = self.spaces.index("GO")
+        self.jail_position = self.spaces.index("Jail")
+        self.handlers = [space_handler(space) for space in self.spaces]
+
+    def get_space(self, position):
+        return self.spaces[position]
+
+    def to_arrays(self, players):
+        return BoardArrays(self, players)
+
+
+class BoardArrays:
+    """Column-per-field snapshot of the board, indexed by position.
+
+    The live game keeps using Property objects; this layout is what bulk,
+    vectorized computations (e.g. simulation) read from. Non-property spaces
+    have zero cost/rent and an owner index of -1; taxes holds what landing on
+    each space charges.
+    """
+
+    def __init__(self, board, players):
+        owner_index = {id(p): i for i, p in enumerate(players)}
+        levels = max(len(s.rent_levels) for s in board.spaces if isinstance(s, Property))
+        n = board.size
+
+        self.is_property = np.zeros(n, dtype=bool)
+        self.costs = np.zeros(n, dtype=np.int32)
+        self.base_rent = np.zeros(n, dtype=np.int32)
+        self.rent_table = np.zeros((n, levels), dtype=np.int32)
+        self.owner_idx = np.full(n, -1, dtype=np.int32)
+        self.houses = np.zeros(n, dtype=np.int8)
+        self.hotel = np.zeros(n, dtype=bool)
+        self.mortgaged = np.zeros(n, dtype=bool)
+        self.taxes = np.zeros(n, dtype=np.int32)
+
+        for pos, space in enumerate(board.spaces):
+            if not isinstance(space, Property):
+                if space == "Income Tax":
+                    self.taxes[pos] = INCOME_TAX
+                continue
+            self.is_property[pos] = True
+            self.costs[pos] = space.cost
+            self.base_rent[pos] = space.base_rent
+            self.rent_table[pos, :len(space.rent_levels)] = space.rent_levels
+            if space.owner is not None:
+                self.owner_idx[pos] = owner_index.get(id(space.owner), -1)
+            self.houses[pos] = space.houses
+            self.hotel[pos] = space.hotel
+            self.mortgaged[pos] = space.mortgaged
+
+    def rents(self):
+        """Rent owed at every position, matching Property.get_rent()."""
+        level = np.where(self.hotel, self.rent_table.shape[1] - 1, self.houses)
+        rent = self.rent_table[np.arange(len(level)), level]
+        return np.where(self.mortgaged | ~self.is_property, 0, rent)
+
+
+class Game:
+    def __init__(self):
+        self.players = []
+        self._by_name = {}
+        self.board = Board()
+        self.turn_index = 0
+        self.ended = False
+        self.active_count = 0   # Players who are not bankrupt
+        self.winner = None
+        self.version = 0        # Bumped on every mutation; drives /state's ETag
+
+    def clear_players(self):
+        self.players = []
+        self._by_name = {}
+        self.turn_index = 0
+        self.ended = False
+        self.active_count = 0
+        self.winner = None
+
+    def add_player(self, name):
+        player = Player(name)
+        self.players.append(player)
+        self._by_name.setdefault(name, player)
+        self.active_count += 1
+
+    def get_player(self, name):
+        return self._by_name.get(name)
+
+    def declare_bankruptcy(self, player):
+        if not player.bankrupt:
+            self.active_count -= 1
+        player.declare_bankruptcy()
+
+    def current_player(self):
+        if not self.players:
+            return None
+        return self.players[self.turn_index]
+
+    def roll_dice(self):
+        return roll_dice_pair()
+
+    def next_turn(self):
+        if not self.players:
+            return
+        self.turn_index = (self.turn_index + 1) % len(self.players)
+
+        # Skip bankrupt players automatically
+        for _ in range(len(self.players)):
+            if not self.players[self.turn_index].bankrupt:
+                break
+            self.turn_index = (self.turn_index + 1) % len(self.players)
+
+    def check_game_end(self):
+        if self.winner is None and self.active_count == 1:
+            self.ended = True
+            self.winner = next(p.name for p in self.players if not p.bankrupt)
+        return self.winner
+
+    def reset(self):
+        # Keep the version monotonic so clients never revalidate a stale ETag
+        version = self.version
+        self.__init__()
+        self.version = version + 1
+
+
+# ---------------------------------------------
+# HELPER: CARD EFFECTS
+# ---------------------------------------------
+# Each card is turned into a closure once at import, so drawing a card just
+# calls card["fn"] instead of re-checking its type on every draw.
+def make_card_effect(card):
+    kind = card["type"]
+    if kind == "move":
+        position = card["position"]
+
+        def effect(game, player, result):
+            player.position = position
+            result["action"] = f"{player.name} moves to position {position}."
+    elif kind == "jail":
+        def effect(game, player, result):
+            player.go_to_jail(game.board.jail_position)
+            result["action"] = f"{player.name} is sent to jail!"
+    elif kind == "money":
+        amount = card["amount"]
+        outcome = f"{'receives' if amount > 0 else 'pays'} ${abs(amount)}."
+
+        def effect(game, player, result):
+            player.adjust_money(amount)
+            result["action"] = f"{player.name} {outcome}"
+    elif kind == "card":
+        def effect(game, player, result):
+            player.get_out_of_jail_cards += 1
+            result["action"] = f"{player.name} receives a Get Out of Jail Free card."
+    elif kind == "move_relative":
+        steps = card["steps"]
+
+        def effect(game, player, result):
+            player.move(steps, game.board)
+            result["action"] = f"{player.name} moves {steps} spaces."
+    else:
+        raise ValueError(f"Unknown card type: {kind}")
+    return effect
+
+
+def compile_deck(cards):
+    return [{"text": card["text"], "fn": make_card_effect(card)} for card in cards]
+
+
+# ---------------------------------------------
+# RANDOM CARDS
+# ---------------------------------------------
+CHANCE_CARDS = compile_deck([
+    {"text": "Advance to GO", "type": "move", "position": 0},
+    {"text": "Go to Jail", "type": "jail"},
+    {"text": "Bank error in your favor, collect $200", "type": "money", "amount": 200},
+    {"text": "Doctor's fees, pay $50", "type": "money", "amount": -50},
+])
+
+COMMUNITY_CHEST_CARDS = compile_deck([
+    {"text": "You inherit $100", "type": "money", "amount": 100},
+    {"text": "Pay hospital fees of $100", "type": "money", "amount": -100},
+    {"text": "Get Out of Jail Free card", "type": "card"},
+    {"text": "Go back 3 spaces", "type": "move_relative", "steps": -3},
+])
+
+
+# ---------------------------------------------
+# SPACE HANDLERS
+# ---------------------------------------------
+# Board.handlers holds one of these per position, so roll() resolves a
+# landing with a single lookup instead of an isinstance/string chain.
+
+def _handle_property(game, player, space, result):
+    if space.owner is None:
+        result["action"] = f"Unowned property: {space.name} (Cost: {space.cost})"
+    elif space.owner != player and not space.mortgaged:
+        rent = space.get_rent()
+        player.adjust_money(-rent)
+        space.owner.adjust_money(rent)
+        result["action"] = f"Paid rent of ${rent} to {space.owner.name}"
+
+
+def _handle_income_tax(game, player, space, result):
+    player.adjust_money(-INCOME_TAX)
+    result["action"] = f"{player.name} paid ${INCOME_TAX} in taxes."
+
+
+def _handle_chance(game, player, space, result):
+    card = draw_card(CHANCE_CARDS)
+    result["card"] = card["text"]
+    card["fn"](game, player, result)
+
+
+def _handle_community(game, player, space, result):
+    card = draw_card(COMMUNITY_CHEST_CARDS)
+    result["card"] = card["text"]
+    card["fn"](game, player, result)
+
+
+def _handle_jail_visit(game, player, space, result):
+    result["action"] = f"{player.name} is just visiting jail"
+
+
+def _handle_noop(game, player, space, result):
+    result["action"] = f"Landed on {space}"
+
+
+SPACE_HANDLERS = {
+    "Income Tax": _handle_income_tax,
+    "Chance": _handle_chance,
+    "Community Chest": _handle_community,
+    "Jail": _handle_jail_visit,
+}
+
+
+def space_handler(space):
+    if isinstance(space, Property):
+        return _handle_property
+    return SPACE_HANDLERS.get(space, _handle_noop)
+
+
+# ---------------------------------------------
+# BULK SIMULATION
+# ---------------------------------------------
+# Monte Carlo play-outs of the current game for balancing and AI work. The
+# turn loop runs over BoardArrays columns only, so numba can compile it.
+# The plain-Python fallback is ~100x slower, so it gets much lower caps.
+MAX_SIMULATED_GAMES = 100_000 if JIT_COMPILED else 2_000
+MAX_SIMULATED_TURNS = 2_000 if JIT_COMPILED else 500
+
+
+@njit(cache=True, nogil=True)
+def simulate_games(n_games, max_turns, seed, first_player, money0, position0,
+                   bankrupt0, in_jail0, owner0, rents, costs, is_property, taxes,
+                   jail_position):
+    """Play n_games out from the given state; return (winners, turns, landings, money_total).
+
+    money_total[i] is player i's final money summed over all games, so memory
+    stays O(n_players) however many games are played.
+
+    Simplified rules: players always buy unowned property they can afford,
+    never build, and go bankrupt as soon as their money drops below zero.
+    Chance and Community Chest cards are not drawn. winners[g] is -1 when game
+    g is still undecided after max_turns.
+    """
+    n_players = money0.shape[0]
+    n_spaces = rents.shape[0]
+    # numba doesn't bounds-check, so a bad index would write past the arrays
+    if first_player < 0 or first_player >= n_players:
+        raise ValueError("first_player out of range")
+    np.random.seed(seed)
+    winners = np.full(n_games, -1, dtype=np.int64)
+    turns = np.zeros(n_games, dtype=np.int64)
+    landings = np.zeros(n_spaces, dtype=np.int64)
+    money_total = np.zeros(n_players, dtype=np.int64)
+    money = np.empty(n_players, dtype=np.int64)
+
+    for g in range(n_games):
+        money[:] = money0
+        position = position0.copy()
+        bankrupt = bankrupt0.copy()
+        in_jail = in_jail0.copy()
+        owner = owner0.copy()
+        doubles = np.zeros(n_players, dtype=np.int64)
+        active = n_players - bankrupt.sum()
+        # /bankrupt and /forfeit leave turn_index on the player who went out
+        p = first_player
+        for _ in range(n_players):
+            if not bankrupt[p]:
+                break
+            p = (p + 1) % n_players
+
+        t = 0
+        while t < max_turns and active > 1:
+            t += 1
+            d1 = np.random.randint(1, 7)
+            d2 = np.random.randint(1, 7)
+            moves = True
+            if in_jail[p]:
+                if d1 == d2:
+                    in_jail[p] = False
+                else:
+                    moves = False
+            elif d1 == d2:
+                doubles[p] += 1
+                if doubles[p] == 3:
+                    position[p] = jail_position
+                    in_jail[p] = True
+                    doubles[p] = 0
+                    moves = False
+            else:
+                doubles[p] = 0
+
+            if moves:
+                pos = (position[p] + d1 + d2) % n_spaces
+                position[p] = pos
+                landings[pos] += 1
+                if is_property[pos]:
+                    o = owner[pos]
+                    if o < 0:
+                        if money[p] >= costs[pos]:
+                            money[p] -= costs[pos]
+                            owner[pos] = p
+                    elif o != p:
+                        money[p] -= rents[pos]
+                        money[o] += rents[pos]
+                else:
+                    money[p] -= taxes[pos]
+
+                if money[p] < 0 and not bankrupt[p]:
+                    bankrupt[p] = True
+                    active -= 1
+                    for s in range(n_spaces):
+                        if owner[s] == p:
+                            owner[s] = -1
+
+            for _ in range(n_players):
+                p = (p + 1) % n_players
+                if not bankrupt[p]:
+                    break
+
+        turns[g] = t
+        money_total += money
+        if active == 1:
+            for i in range(n_players):
+                if not bankrupt[i]:
+                    winners[g] = i
+
+    return winners, turns, landings, money_total
+
+
+def simulation_inputs(game):
+    """Copy the game state into the arrays simulate_games() takes, after its
+    first three arguments."""
+    players = game.players
+    if not players:
+        raise ValueError("simulation needs at least one player")
+    arrays = game.board.to_arrays(players)
+    return (
+        game.turn_index % len(players),
+        np.array([p.money for p in players], dtype=np.int64),
+        np.array([p.position for p in players], dtype=np.int64),
+        np.array([p.bankrupt for p in players], dtype=np.bool_),
+        np.array([p.in_jail for p in players], dtype=np.bool_),
+        arrays.owner_idx.astype(np.int64),
+        arrays.rents().astype(np.int64),
+        arrays.costs.astype(np.int64),
+        arrays.is_property,
+        arrays.taxes.astype(np.int64),
+        game.board.jail_position,
+    )
+
+
+def run_off_event_loop(fn, *args):
+    """Call fn on gevent's native threadpool when serving under gevent, so a
+    long CPU-bound call (the nogil kernel) doesn't block other requests."""
+    try:
+        from gevent import monkey
+    except ImportError:
+        return fn(*args)
+    if not monkey.is_module_patched("threading"):
+        return fn(*args)
+    import gevent
+    return gevent.get_hub().threadpool.apply(fn, args)
+
+
+def simulate(inputs, names, n_games, max_turns, seed):
+    winners, turns, landings, money_total = run_off_event_loop(
+        simulate_games, n_games, max_turns, seed, *inputs)
+    wins = np.bincount(winners[winners >= 0], minlength=len(names))
+    total_landings = landings.sum()
+    return {
+        "games": n_games,
+        "seed": seed,
+        # Listed in turn order; names are not unique
+        "players": [
+            {"name": name, "wins": int(wins[i]), "average_money": float(money_total[i] / n_games)}
+            for i, name in enumerate(names)
+        ],
+        "undecided": int((winners < 0).sum()),
+        "average_turns": float(turns.mean()),
+        "landing_frequency": (landings / total_landings).tolist() if total_landings else [],
+    }
+
+
+# ---------------------------------------------
+# APP FACTORY
+# ---------------------------------------------
+bp = Blueprint("monopoly", __name__)
+
+
+def create_app():
+    app = Flask(__name__)
+    if _encode_json is not None:
+        app.json = FastJSONProvider(app)
+    # Every route reads or mutates the shared game, so handlers run one at a
+    # time. gevent's monkey patching makes this a greenlet-aware lock.
+    app.extensions["monopoly"] = {"game": Game(), "lock": threading.RLock()}
+    app.register_blueprint(bp)
+    return app
+
+
+def synchronized(view):
+    """Run the view under the game lock, passing the app's game as first argument."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        state = current_app.extensions["monopoly"]
+        with state["lock"]:
+            return view(state["game"], *args, **kwargs)
+    return wrapper
+
+
+def mutating(view):
+    """Like synchronized, and bumps game.version so cached /state goes stale."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        state = current_app.extensions["monopoly"]
+        with state["lock"]:
+            game = state["game"]
+            game.version += 1
+            return view(game, *args, **kwargs)
+    return wrapper
+
+
+def wants_msgpack():
+    if msgpack is None:
+        return False
+    best = request.accept_mimetypes.best_match(["application/json", MSGPACK_MIMETYPE])
+    return best == MSGPACK_MIMETYPE
+
+
+def negotiated(payload):
+    """Respond with msgpack when the client prefers it, JSON otherwise."""
+    if msgpack is not None:
+        if wants_msgpack():
+            response = current_app.response_class(msgpack.packb(payload, use_bin_type=True), mimetype=MSGPACK_MIMETYPE)
+        else:
+            response = jsonify(payload)
+        response.vary.add("Accept")
+        return response
+    return jsonify(payload)
+
+
+# ---------------------------------------------
+# BACKGROUND PERSISTENCE
+# ---------------------------------------------
+# When MONOPOLY_SNAPSHOT names a file, every finished turn is persisted there.
+# The snapshot is taken under the game lock, but encoding and disk I/O happen
+# on a background thread so /roll doesn't wait on them. One worker keeps the
+# writes in turn order.
+#
+# The file holds a full msgpack snapshot; later turns only append the fields
+# that changed to "<path>.log". Every FULL_SNAPSHOT_EVERY writes (or whenever
+# the set of players changes) the full snapshot is rewritten and the log
+# restarted. load_snapshot() replays both.
+#
+# Each full snapshot carries a random base id, and the log starts with the id
+# of the snapshot it extends. A crash between replacing the snapshot and
+# restarting the log leaves a log whose id doesn't match, and that stale log
+# is ignored instead of being replayed over newer state.
+SNAPSHOT_PATH = os.environ.get("MONOPOLY_SNAPSHOT")
+FULL_SNAPSHOT_EVERY = 50
+executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="persist")
+
+
+def snapshot(game):
+    owner_index = {id(p): i for i, p in enumerate(game.players)}
+    return {
+        "version": game.version,
+        "turn_index": game.turn_index,
+        "ended": game.ended,
+        "players": [
+            {
+                "name": p.name,
+                "money": p.money,
+                "position": p.position,
+                "bankrupt": p.bankrupt,
+                "in_jail": p.in_jail,
+                "jail_turns": p.jail_turns,
+                "doubles_count": p.doubles_count,
+                "get_out_of_jail_cards": p.get_out_of_jail_cards,
+            }
+            for p in game.players
+        ],
+        "properties": [
+            {
+                "position": pos,
+                "owner": owner_index.get(id(space.owner)),
+                "houses": space.houses,
+                "hotel": space.hotel,
+                "mortgaged": space.mortgaged,
+            }
+            for pos, space in enumerate(game.board.spaces)
+            if isinstance(space, Property)
+        ],
+    }
+
+
+def _flatten(data):
+    flat = {("game", key): value for key, value in data.items() if key not in ("players", "properties")}
+    for section in ("players", "properties"):
+        for i, entry in enumerate(data[section]):
+            for key, value in entry.items():
+                flat[(section, i, key)] = value
+    return flat
+
+
+class SnapshotWriter:
+    """Writes full snapshots and per-turn deltas; only used from the executor."""
+
+    def __init__(self):
+        self.last = None
+        self.writes = 0
+
+    def write(self, data, path):
+        flat = _flatten(data)
+        if self.last is not None and flat[("game", "version")] == self.last[("game", "version")]:
+            return
+        if (self.last is None or self.writes % FULL_SNAPSHOT_EVERY == 0
+                or flat.keys() != self.last.keys()):
+            base = os.urandom(8)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(msgpack.packb({"base": base, "state": data}, use_bin_type=True))
+            os.replace(tmp_path, path)
+            with open(f"{path}.log", "wb") as f:
+                f.write(msgpack.packb(base, use_bin_type=True))
+        else:
+            changes = [key + (value,) for key, value in flat.items() if self.last[key] != value]
+            with open(f"{path}.log", "ab") as f:
+                f.write(msgpack.packb(changes, use_bin_type=True))
+        self.last = flat
+        self.writes += 1
+
+
+def load_snapshot(path):
+    """Rebuild the latest persisted snapshot from the full file plus its log."""
+    with open(path, "rb") as f:
+        full = msgpack.unpackb(f.read(), raw=False)
+    data = full["state"]
+    if os.path.exists(f"{path}.log"):
+        with open(f"{path}.log", "rb") as f:
+            log = msgpack.Unpacker(f, raw=False)
+            if next(log, None) != full["base"]:
+                return data
+            for changes in log:
+                for change in changes:
+                    if change[0] == "game":
+                        data[change[1]] = change[2]
+                    else:
+                        section, i, key, value = change
+                        data[section][i][key] = value
+    return data
+
+
+snapshot_writer = SnapshotWriter()
+
+
+def _log_persist_failure(logger, future):
+    error = future.exception()
+    if error is not None:
+        logger.error("Failed to persist game to %s", SNAPSHOT_PATH, exc_info=error)
+
+
+def schedule_persist(game):
+    if SNAPSHOT_PATH and msgpack is not None:
+        future = executor.submit(snapshot_writer.write, snapshot(game), SNAPSHOT_PATH)
+        future.add_done_callback(functools.partial(_log_persist_failure, current_app.logger))
+        return True
+    return False
+
+
+# ---------------------------------------------
+# FLASK ROUTES
+# ---------------------------------------------
+
+@bp.route("/start", methods=["POST"])
+@mutating
+def start_game(game):
+    data = request.get_json()
+    game.clear_players()
+    for name in data.get("players", []):
+        game.add_player(name)
+    return jsonify({"message": "Game started!", "players": [p.name for p in game.players]})
+
+
+@bp.route("/roll", methods=["POST"])
+@mutating
+def roll(game):
+    player = game.current_player()
+    if not player:
+        return jsonify({"message": "No players in game."}), 400
+
+    dice = game.roll_dice()
+    steps = sum(dice)
+    result = {"player": player.name, "dice": dice}
+
+    # Jail logic
+    if player.in_jail:
+        if dice[0] == dice[1]:
+            player.in_jail = False
+            result["action"] = f"{player.name} rolled doubles and got out of jail!"
+            player.move(steps, game.board)
+        else:
+            player.jail_turns += 1
+            result["action"] = f"{player.name} is still in jail (Turn {player.jail_turns})"
+            game.next_turn()
+            schedule_persist(game)
+            return negotiated(result)
+    else:
+        # Doubles logic outside jail
+        if dice[0] == dice[1]:
+            player.doubles_count += 1
+            if player.doubles_count == 3:
+                player.go_to_jail(game.board.jail_position)
+                result["action"] = f"{player.name} rolled doubles thrice and is sent to jail!"
+                game.next_turn()
+                schedule_persist(game)
+                return negotiated(result)
+        else:
+            player.doubles_count = 0
+        player.move(steps, game.board)
+
+    space = game.board.get_space(player.position)
+    result["new_position"] = player.position
+
+    # Resolve space actions
+    game.board.handlers[player.position](game, player, space, result)
+
+    # End game check
+    winner = game.check_game_end()
+    if winner:
+        result["game_over"] = True
+        result["winner"] = winner
+
+    game.next_turn()
+    schedule_persist(game)
+    return negotiated(result)
+
+
+@bp.route("/state", methods=["GET"])
+@synchronized
+def state(game):
+    # Each representation gets its own tag, so a JSON ETag never validates msgpack
+    etag = f"v{game.version}-mp" if wants_msgpack() else f"v{game.version}"
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+        response.vary.add("Accept")
+    else:
+        response = negotiated({"players": _player_summaries(game), "game_over": game.ended})
+    response.set_etag(etag, weak=True)
+    response.cache_control.no_cache = True
+    return response
+
+
+def _player_summaries(game):
+    data = []
+    for p in game.players:
+        houses = 0
+        hotels = 0
+        names = []
+        # One pass over the properties instead of three
+        for prop in p.properties:
+            houses += prop.houses
+            if prop.hotel:
+                hotels += 1
+            names.append(prop.name)
+        data.append({
+            "name": p.name,
+            "money": p.money,
+            "position": p.position,
+            "properties": names,
+            "bankrupt": p.bankrupt,
+            "in_jail": p.in_jail,
+            "houses": houses,
+            "hotels": hotels,
+        })
+    return data
+
+
+@bp.route("/buy", methods=["POST"])
+@mutating
+def buy(game):
+    player = game.current_player()
+    space = game.board.get_space(player.position)
+    if isinstance(space, Property) and space.buy(player):
+        return jsonify({"message": f"{player.name} bought {space.name}"})
+    return jsonify({"message": "Cannot buy this space"})
+
+
+@bp.route("/build_house", methods=["POST"])
+@mutating
+def build_house(game):
+    player = game.current_player()
+    name = request.get_json().get("property")
+    prop = player.get_property(name)
+    if prop and prop.build_house(player):
+        return jsonify({"message": f"Built a house on {prop.name}"})
+    return jsonify({"message": "Failed to build house"})
+
+
+@bp.route("/build_hotel", methods=["POST"])
+@mutating
+def build_hotel(game):
+    player = game.current_player()
+    name = request.get_json().get("property")
+    prop = player.get_property(name)
+    if prop and prop.build_hotel(player):
+        return jsonify({"message": f"Built a hotel on {prop.name}"})
+    return jsonify({"message": "Failed to build hotel"})
+
+
+@bp.route("/trade", methods=["POST"])
+@mutating
+def trade(game):
+    data = request.get_json()
+    from_p = game.get_player(data["from"])
+    to_p = game.get_player(data["to"])
+    if not from_p or not to_p:
+        return jsonify({"message": "Invalid players"}), 400
+
+    offer_money = data.get("offer", {}).get("money", 0)
+    prop_name = data.get("request", {}).get("property")
+
+    if offer_money > 0 and from_p.money >= offer_money:
+        from_p.adjust_money(-offer_money)
+        to_p.adjust_money(offer_money)
+
+    prop = from_p.get_property(prop_name)
+    if prop:
+        from_p.remove_property(prop)
+        to_p.add_property(prop)
+        prop.owner = to_p
+
+    return jsonify({"message": f"{from_p.name} traded with {to_p.name}"})
+
+
+@bp.route("/mortgage", methods=["POST"])
+@mutating
+def mortgage(game):
+    player = game.current_player()
+    name = request.get_json().get("property")
+    prop = player.get_property(name)
+    if prop and prop.mortgage(player):
+        return jsonify({"message": f"{player.name} mortgaged {prop.name}"})
+    return jsonify({"message": "Mortgage failed"})
+
+
+@bp.route("/unmortgage", methods=["POST"])
+@mutating
+def unmortgage(game):
+    player = game.current_player()
+    name = request.get_json().get("property")
+    prop = player.get_property(name)
+    if prop and prop.unmortgage(player):
+        return jsonify({"message": f"{player.name} unmortgaged {prop.name}"})
+    return jsonify({"message": "Unmortgage failed"})
+
+
+@bp.route("/bankrupt", methods=["POST"])
+@mutating
+def bankrupt(game):
+    player = game.current_player()
+    game.declare_bankruptcy(player)
+    return jsonify({"message": f"{player.name} is bankrupt"})
+
+
+@bp.route("/forfeit", methods=["POST"])
+@mutating
+def forfeit(game):
+    player = game.current_player()
+    game.declare_bankruptcy(player)
+    return jsonify({"message": f"{player.name} forfeited the game"})
+
+
+@bp.route("/use_jail_card", methods=["POST"])
+@mutating
+def use_jail_card(game):
+    player = game.current_player()
+    if player.in_jail and player.get_out_of_jail_cards > 0:
+        player.in_jail = False
+        player.get_out_of_jail_cards -= 1
+        return jsonify({"message": f"{player.name} used a Get Out of Jail Free card"})
+    return jsonify({"message": "No card available or not in jail"})
+
+
+@bp.route("/save", methods=["POST"])
+@synchronized
+def save(game):
+    if schedule_persist(game):
+        return jsonify({"message": "Game saved.", "version": game.version})
+    return jsonify({"message": "Saving is disabled; set MONOPOLY_SNAPSHOT."}), 400
+
+
+@bp.route("/simulate", methods=["GET"])
+def simulate_route():
+    games = min(request.args.get("games", 1000, type=int), MAX_SIMULATED_GAMES)
+    turns = min(request.args.get("turns", 500, type=int), MAX_SIMULATED_TURNS)
+    seed = request.args.get("seed", random.getrandbits(32), type=int) & 0xFFFFFFFF
+    if games < 1 or turns < 1:
+        return jsonify({"message": "games and turns must be positive"}), 400
+
+    state = current_app.extensions["monopoly"]
+    # Only the inputs are taken under the lock; the play-outs run without it
+    with state["lock"]:
+        game = state["game"]
+        if not game.players:
+            return jsonify({"message": "No players in game."}), 400
+        inputs = simulation_inputs(game)
+        names = [p.name for p in game.players]
+    return jsonify(simulate(inputs, names, games, turns, seed))
+
+
+@bp.route("/reset", methods=["POST"])
+@mutating
+def reset(game):
+    game.reset()
+    return jsonify({"message": "Game has been reset."})
+
+
+# ---------------------------------------------
+# RUN SERVER
+# ---------------------------------------------
+# Development server only; production runs under gunicorn (gunicorn_conf.py).
+# The Werkzeug debugger and reloader are opt-in via FLASK_DEBUG=1.
+if __name__ == "__main__":
+    create_app().run(
+        debug=os.environ.get("FLASK_DEBUG") == "1",
+        host=os.environ.get("HOST", "127.0.0.1"),
+        port=int(os.environ.get("PORT", 5000)),
+    )
@@ -0,0 +1,56 @@
+import pytest
+
+import monopoly
+
+CHANCE_POSITION = 6
+COMMUNITY_CHEST_POSITION = 2
+
+
+def _card(deck, text):
+    return next(card for card in deck if card["text"] == text)
+
+
+def _draw(monkeypatch, deck, text, position):
+    client = monopoly.create_app().test_client()
+    client.post("/start", json={"players": ["a", "b"]})
+    game = client.application.extensions["monopoly"]["game"]
+    player = game.current_player()
+    # Land on the deck's space with an 8 rolled as (3, 5)
+    player.position = (position - 8) % game.board.size
+    card = _card(deck, text)
+    monkeypatch.setattr(monopoly, "roll_dice_pair", lambda: (3, 5))
+    monkeypatch.setattr(monopoly, "draw_card", lambda d: card)
+    return client.post("/roll").get_json(), player
+
+
+@pytest.mark.parametrize("text, action, money, position, in_jail", [
+    ("Advance to GO", "a moves to position 0.", 1500, 0, False),
+    ("Go to Jail", "a is sent to jail!", 1500, 9, True),
+    ("Bank error in your favor, collect $200", "a receives $200.", 1700, CHANCE_POSITION, False),
+    ("Doctor's fees, pay $50", "a pays $50.", 1450, CHANCE_POSITION, False),
+])
+def test_chance_cards(monkeypatch, text, action, money, position, in_jail):
+    result, player = _draw(monkeypatch, monopoly.CHANCE_CARDS, text, CHANCE_POSITION)
+
+    assert result["card"] == text
+    assert result["action"] == action
+    assert (player.money, player.position, player.in_jail) == (money, position, in_jail)
+
+
+@pytest.mark.parametrize("text, action, money, position, jail_cards", [
+    ("You inherit $100", "a receives $100.", 1600, COMMUNITY_CHEST_POSITION, 0),
+    ("Pay hospital fees of $100", "a pays $100.", 1400, COMMUNITY_CHEST_POSITION, 0),
+    ("Get Out of Jail Free card", "a receives a Get Out of Jail Free card.", 1500, COMMUNITY_CHEST_POSITION, 1),
+    ("Go back 3 spaces", "a moves -3 spaces.", 1500, 16, 0),
+])
+def test_community_chest_cards(monkeypatch, text, action, money, position, jail_cards):
+    result, player = _draw(monkeypatch, monopoly.COMMUNITY_CHEST_CARDS, text, COMMUNITY_CHEST_POSITION)
+
+    assert result["card"] == text
+    assert result["action"] == action
+    assert (player.money, player.position, player.get_out_of_jail_cards) == (money, position, jail_cards)
+
+
+def test_unknown_card_type_is_rejected_at_compile_time():
+    with pytest.raises(ValueError):
+        monopoly.compile_deck([{"text": "?", "type": "teleport"}])
@@ -0,0 +1,69 @@
+import monopoly
+
+
+def _client(*names):
+    client = monopoly.create_app().test_client()
+    client.post("/start", json={"players": list(names)})
+    return client
+
+
+def test_restart_with_fewer_players_resets_turn_and_game_over():
+    client = _client("a", "b", "c", "d", "e")
+    for _ in range(4):
+        client.post("/roll")
+    game = client.application.extensions["monopoly"]["game"]
+    game.ended = True
+
+    client.post("/start", json={"players": ["x", "y"]})
+
+    assert client.post("/roll").get_json()["player"] == "x"
+    assert client.get("/state").get_json()["game_over"] is False
+
+
+def _game(client):
+    return client.application.extensions["monopoly"]["game"]
+
+
+def test_bought_property_can_be_traded_and_built_on_by_receiver():
+    client = _client("a", "b")
+    game = _game(client)
+    a, b = game.players
+    a.position = 1  # Renzo House
+
+    assert client.post("/buy").get_json()["message"] == "a bought Renzo House"
+    client.post("/trade", json={"from": "a", "to": "b", "request": {"property": "Renzo House"}})
+    game.turn_index = 1
+    response = client.post("/build_house", json={"property": "Renzo House"})
+
+    renzo = game.board.spaces[1]
+    assert response.get_json()["message"] == "Built a house on Renzo House"
+    assert renzo.owner is b and renzo.houses == 1
+    assert a.get_property("Renzo House") is None and a.properties == []
+    assert b.get_property("Renzo House") is renzo and b.properties == [renzo]
+
+
+def test_former_owner_cannot_build_after_trading_away():
+    client = _client("a", "b")
+    game = _game(client)
+    game.players[0].position = 1
+    client.post("/buy")
+    client.post("/trade", json={"from": "a", "to": "b", "request": {"property": "Renzo House"}})
+
+    response = client.post("/build_house", json={"property": "Renzo House"})
+
+    assert response.get_json()["message"] == "Failed to build house"
+
+
+def test_bankruptcy_clears_both_property_indexes():
+    client = _client("a", "b", "c")
+    game = _game(client)
+    a = game.players[0]
+    for position in (1, 3):
+        a.position = position
+        client.post("/buy")
+
+    client.post("/bankrupt")
+
+    assert a.properties == [] and a.get_property("Renzo House") is None
+    assert game.board.spaces[1].owner is None and game.board.spaces[3].owner is None
+    assert game.active_count == 2
@@ -0,0 +1,56 @@
+import pytest
+
+import monopoly
+
+
+@pytest.fixture
+def client():
+    client = monopoly.create_app().test_client()
+    client.post("/start", json={"players": ["a", "b"]})
+    return client
+
+
+def _roll(client, monkeypatch, dice, position=0):
+    game = client.application.extensions["monopoly"]["game"]
+    game.current_player().position = position
+    monkeypatch.setattr(monopoly, "roll_dice_pair", lambda: dice)
+    return client.post("/roll").get_json(), game
+
+
+def test_landing_on_unowned_property(client, monkeypatch):
+    result, _ = _roll(client, monkeypatch, (2, 3))
+
+    assert result["new_position"] == 5
+    assert result["action"] == "Unowned property: Crisostomo Plaza (Cost: 200)"
+
+
+def test_landing_on_owned_property_pays_rent(client, monkeypatch):
+    game = client.application.extensions["monopoly"]["game"]
+    a, b = game.players
+    game.board.spaces[5].buy(b)
+
+    result, _ = _roll(client, monkeypatch, (2, 3))
+
+    assert result["action"] == "Paid rent of $25 to b"
+    assert a.money == 1500 - 25
+    assert b.money == 1500 - 200 + 25
+
+
+def test_landing_on_income_tax(client, monkeypatch):
+    result, game = _roll(client, monkeypatch, (1, 3))
+
+    assert result["action"] == "a paid $200 in taxes."
+    assert game.players[0].money == 1300
+
+
+def test_landing_on_jail_is_just_visiting(client, monkeypatch):
+    result, game = _roll(client, monkeypatch, (4, 5))
+
+    assert result["action"] == "a is just visiting jail"
+    assert not game.players[0].in_jail
+
+
+def test_landing_on_free_parking(client, monkeypatch):
+    result, _ = _roll(client, monkeypatch, (2, 3), position=10)
+
+    assert result["action"] == "Landed on Free Parking"
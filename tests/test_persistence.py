@@ -0,0 +1,61 @@
+import shutil
+
+import monopoly
+
+
+def _play(client, rolls):
+    for _ in range(rolls):
+        client.post("/roll")
+        client.post("/buy")
+        client.post("/build_house", json={"property": "Renzo House"})
+
+
+def _setup():
+    app = monopoly.create_app()
+    client = app.test_client()
+    client.post("/start", json={"players": ["a", "b", "c"]})
+    return client, app.extensions["monopoly"]["game"]
+
+
+def test_load_snapshot_round_trips_deltas_and_full_rewrites(tmp_path, monkeypatch):
+    monkeypatch.setattr(monopoly, "FULL_SNAPSHOT_EVERY", 7)
+    path = str(tmp_path / "game.mp")
+    writer = monopoly.SnapshotWriter()
+    client, game = _setup()
+
+    for _ in range(30):
+        _play(client, 1)
+        writer.write(monopoly.snapshot(game), path)
+        assert monopoly.load_snapshot(path) == monopoly.snapshot(game)
+
+
+def test_stale_log_is_ignored_after_crash_before_log_restart(tmp_path):
+    path = str(tmp_path / "game.mp")
+    writer = monopoly.SnapshotWriter()
+    client, game = _setup()
+
+    writer.write(monopoly.snapshot(game), path)
+    for _ in range(3):
+        _play(client, 1)
+        writer.write(monopoly.snapshot(game), path)
+    shutil.copy(f"{path}.log", tmp_path / "old.log")
+
+    # Force a full rewrite, then put the old log back as if the process died
+    # right after os.replace() and before the log was restarted.
+    _play(client, 1)
+    writer.writes = 0
+    writer.write(monopoly.snapshot(game), path)
+    shutil.copy(tmp_path / "old.log", f"{path}.log")
+
+    assert monopoly.load_snapshot(path) == monopoly.snapshot(game)
+
+
+def test_persist_failures_are_logged(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(monopoly, "SNAPSHOT_PATH", str(tmp_path / "missing" / "game.mp"))
+    monkeypatch.setattr(monopoly, "snapshot_writer", monopoly.SnapshotWriter())
+    client, _ = _setup()
+
+    client.post("/save")
+    monopoly.executor.submit(lambda: None).result()
+
+    assert "Failed to persist game" in caplog.text
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+import monopoly
+
+
+def _game(*names):
+    game = monopoly.Game()
+    for name in names:
+        game.add_player(name)
+    return game
+
+
+def test_bankrupt_current_player_does_not_take_a_turn():
+    game = _game("a", "b", "c")
+    # /bankrupt leaves turn_index on the player who went out
+    game.declare_bankruptcy(game.current_player())
+
+    winners, turns, _, money_total = monopoly.simulate_games(
+        5000, 500, 1, *monopoly.simulation_inputs(game))
+
+    assert not (winners == 0).any()
+    assert not ((turns == 1) & (winners >= 0)).any()
+    assert money_total[0] == 0
+
+
+def test_decided_games_have_a_valid_winner():
+    game = _game("a", "b")
+    winners, turns, _, _ = monopoly.simulate_games(
+        500, 2000, 7, *monopoly.simulation_inputs(game))
+
+    decided = winners >= 0
+    assert decided.any()
+    assert set(winners[decided].tolist()) <= {0, 1}
+    assert (turns[decided] > 0).all()
+
+
+def test_money_total_sums_final_balances_over_games():
+    game = _game("a", "b", "c")
+    game.players[1].money = 700
+
+    _, _, _, money_total = monopoly.simulate_games(
+        40, 0, 1, *monopoly.simulation_inputs(game))
+
+    assert money_total.tolist() == [40 * 1500, 40 * 700, 40 * 1500]
+
+
+def test_simulate_route_reports_duplicate_names_separately():
+    client = monopoly.create_app().test_client()
+    client.post("/start", json={"players": ["a", "a", "b"]})
+
+    data = client.get("/simulate?games=50&turns=100&seed=3").get_json()
+
+    assert [p["name"] for p in data["players"]] == ["a", "a", "b"]
+    assert sum(p["wins"] for p in data["players"]) + data["undecided"] == 50
+
+
+def test_board_arrays_handle_high_player_indexes():
+    game = _game(*(f"p{i}" for i in range(200)))
+    game.board.spaces[1].buy(game.players[150])
+
+    arrays = game.board.to_arrays(game.players)
+
+    assert arrays.owner_idx[1] == 150
+
+
+def test_simulate_after_restart_with_fewer_players():
+    client = monopoly.create_app().test_client()
+    client.post("/start", json={"players": ["a", "b", "c", "d", "e"]})
+    for _ in range(4):
+        client.post("/roll")
+    client.post("/start", json={"players": ["x", "y"]})
+
+    response = client.get("/simulate?games=50&turns=100&seed=1")
+
+    assert response.status_code == 200
+    assert [p["name"] for p in response.get_json()["players"]] == ["x", "y"]
+
+
+def test_simulation_inputs_wrap_stale_turn_index():
+    game = _game("a", "b")
+    game.turn_index = 4
+
+    assert monopoly.simulation_inputs(game)[0] == 0
+
+
+def test_kernel_rejects_out_of_range_first_player():
+    inputs = list(monopoly.simulation_inputs(_game("a", "b")))
+    inputs[0] = 4
+
+    with pytest.raises(ValueError):
+        monopoly.simulate_games(1, 10, 1, *inputs)
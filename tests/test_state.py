@@ -0,0 +1,41 @@
+import monopoly
+
+MSGPACK = {"Accept": "application/msgpack"}
+
+
+def _client():
+    client = monopoly.create_app().test_client()
+    client.post("/start", json={"players": ["a", "b"]})
+    return client
+
+
+def test_unchanged_state_revalidates_with_304():
+    client = _client()
+    etag = client.get("/state").headers["ETag"]
+
+    response = client.get("/state", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_etag_from_one_format_does_not_validate_the_other():
+    client = _client()
+    json_etag = client.get("/state").headers["ETag"]
+    msgpack_etag = client.get("/state", headers=MSGPACK).headers["ETag"]
+
+    assert json_etag != msgpack_etag
+    response = client.get("/state", headers={**MSGPACK, "If-None-Match": json_etag})
+    assert response.status_code == 200
+    assert response.mimetype == "application/msgpack"
+    response = client.get("/state", headers={"If-None-Match": msgpack_etag})
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+
+
+def test_mutation_invalidates_etag():
+    client = _client()
+    etag = client.get("/state").headers["ETag"]
+    client.post("/roll")
+
+    assert client.get("/state", headers={"If-None-Match": etag}).status_code == 200
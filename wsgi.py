@@ -0,0 +1,12 @@
+# ---------------------------------------------
+# wsgi.py
+# gunicorn entrypoint for the Monopoly backend
+# ---------------------------------------------
+
+from gevent import monkey
+
+monkey.patch_all()
+
+from monopoly import create_app
+
+app = create_app()